@@ -1,8 +1,10 @@
 import hashlib
 import time
-from datetime import datetime
 
 class Block:
+    # Fields that feed into the hash; assigning any of them invalidates the cached hash
+    HASHED_FIELDS = frozenset({"index", "timestamp", "data", "previous_hash", "nonce"})
+    
     def __init__(self, index, data, previous_hash):
         self.index = index
         self.timestamp = time.time()
@@ -11,10 +13,30 @@ class Block:
         self.nonce = 0
         self.hash = self.calculate_hash()
     
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.HASHED_FIELDS:
+            super().__setattr__("_dirty", True)
+        if name == "timestamp":
+            super().__setattr__("_timestamp_str", None)
+    
+    @property
+    def timestamp_str(self):
+        """Timestamp formatted for display (cached until the timestamp changes)"""
+        if self._timestamp_str is None:
+            self._timestamp_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.timestamp))
+        return self._timestamp_str
+    
+    def serialize(self):
+        """Encode the fields covered by the block hash"""
+        return f"{self.index}{self.timestamp}{self.data}{self.previous_hash}{self.nonce}".encode()
+    
     def calculate_hash(self):
-        """Calculate SHA-256 hash of the block"""
-        block_string = f"{self.index}{self.timestamp}{self.data}{self.previous_hash}{self.nonce}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        """Calculate SHA-256 hash of the block (cached until a hashed field changes)"""
+        if self._dirty:
+            self._cached_hash = hashlib.sha256(self.serialize()).hexdigest()
+            self._dirty = False
+        return self._cached_hash
     
     def display(self):
         """Display block information in a formatted way"""
@@ -22,7 +44,7 @@ class Block:
         print(f"BLOCK {self.index}")
         print(f"{'='*60}")
         print(f"Index:        {self.index}")
-        print(f"Timestamp:    {datetime.fromtimestamp(self.timestamp).strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Timestamp:    {self.timestamp_str}")
         print(f"Data:         {self.data}")
         print(f"Previous Hash: {self.previous_hash}")
         print(f"Hash:         {self.hash}")
@@ -49,16 +71,23 @@ class Blockchain:
     
     def is_chain_valid(self):
         """Validate the entire blockchain"""
+        # Read the chain once into columns: a valid chain's previous-hash column is its
+        # hash column shifted by one, so the common case is two C-level list compares
+        stored_hashes = [block.hash for block in self.chain]
+        computed_hashes = [block.calculate_hash() for block in self.chain[1:]]
+        previous_hashes = [block.previous_hash for block in self.chain]
+        
+        if stored_hashes[1:] == computed_hashes and previous_hashes[1:] == stored_hashes[:-1]:
+            return True, "Blockchain is valid"
+        
+        # Find the first broken block to report
         for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i-1]
-            
             # Check if current block's hash is valid
-            if current_block.hash != current_block.calculate_hash():
+            if stored_hashes[i] != computed_hashes[i-1]:
                 return False, f"Block {i} has invalid hash"
             
             # Check if current block points to previous block
-            if current_block.previous_hash != previous_block.hash:
+            if previous_hashes[i] != stored_hashes[i-1]:
                 return False, f"Block {i} has invalid previous hash"
         
         return True, "Blockchain is valid"
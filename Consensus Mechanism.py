@@ -1,6 +1,7 @@
 import random
 import time
 from datetime import datetime
+from collections import Counter
 
 class Validator:
     """Base validator class for all consensus mechanisms"""
@@ -9,6 +10,7 @@ class Validator:
         self.validator_id = validator_id
         self.blocks_validated = 0
         self.rewards_earned = 0
+        self.rng = random.Random()  # Own generator, independent of other validators
     
     def __str__(self):
         return f"Validator {self.name} (ID: {self.validator_id})"
@@ -18,29 +20,53 @@ class PoWMiner(Validator):
     def __init__(self, name, validator_id, hash_power):
         super().__init__(name, validator_id)
         self.hash_power = hash_power  # Hash rate in MH/s
-        self.electricity_cost = random.uniform(0.05, 0.15)  # Cost per hash
+        self.electricity_cost = self.rng.uniform(0.05, 0.15)  # Cost per hash
     
     def mine_attempt(self):
         """Simulate mining attempt - higher hash power = better chance"""
         # Simulate random mining success based on hash power
-        return random.randint(1, 1000) <= self.hash_power
+        return self.rng.randint(1, 1000) <= self.hash_power
     
     def __str__(self):
         return f"PoW Miner {self.name} (Hash Power: {self.hash_power} MH/s)"
 
 class PoSStaker(Validator):
     """Proof of Stake Staker"""
+    stake_version = 0  # Bumped on any stake change so cached selection tables can tell they are stale
+    
     def __init__(self, name, validator_id, stake_amount):
         super().__init__(name, validator_id)
         self.stake_amount = stake_amount  # Amount of tokens staked
-        self.stake_age = random.randint(1, 365)  # Days staked
+        self.stake_age = self.rng.randint(1, 365)  # Days staked
         self.slashing_risk = 0.01  # Risk of losing stake for bad behavior
     
+    @property
+    def stake_amount(self):
+        return self._stake_amount
+    
+    @stake_amount.setter
+    def stake_amount(self, value):
+        self._stake_amount = value
+        self._weight = None  # Recompute stake weight on next use
+        PoSStaker.stake_version += 1
+    
+    @property
+    def stake_age(self):
+        return self._stake_age
+    
+    @stake_age.setter
+    def stake_age(self, value):
+        self._stake_age = value
+        self._weight = None  # Recompute stake weight on next use
+        PoSStaker.stake_version += 1
+    
     def calculate_stake_weight(self):
         """Calculate effective stake weight (can include age factor)"""
-        # Some PoS systems give bonus for longer staking
-        age_bonus = min(self.stake_age / 365, 0.5)  # Max 50% bonus
-        return self.stake_amount * (1 + age_bonus)
+        if self._weight is None:
+            # Some PoS systems give bonus for longer staking
+            age_bonus = min(self.stake_age / 365, 0.5)  # Max 50% bonus
+            self._weight = self.stake_amount * (1 + age_bonus)
+        return self._weight
     
     def __str__(self):
         return f"PoS Staker {self.name} (Stake: {self.stake_amount:,} tokens, Age: {self.stake_age} days)"
@@ -50,14 +76,16 @@ class DPoSDelegate(Validator):
     def __init__(self, name, validator_id, reputation_score):
         super().__init__(name, validator_id)
         self.votes_received = 0
-        self.voters = []
+        self.voters = []  # Voters and their vote weights, stored as parallel lists
+        self.vote_weights = []
         self.reputation_score = reputation_score  # 0-100 reputation
-        self.commission_rate = random.uniform(0.01, 0.10)  # 1-10% commission
+        self.commission_rate = self.rng.uniform(0.01, 0.10)  # 1-10% commission
     
     def receive_vote(self, voter, vote_weight):
         """Receive a vote from a token holder"""
         self.votes_received += vote_weight
-        self.voters.append({'voter': voter, 'weight': vote_weight})
+        self.voters.append(voter)
+        self.vote_weights.append(vote_weight)
     
     def __str__(self):
         return f"DPoS Delegate {self.name} (Votes: {self.votes_received:,}, Reputation: {self.reputation_score}/100)"
@@ -77,10 +105,36 @@ class Voter:
     def __str__(self):
         return f"Voter {self.name} ({self.token_balance:,} tokens)"
 
+class AliasSampler:
+    """Weighted random sampler using Vose's alias method (O(n) setup, O(1) per draw)"""
+    def __init__(self, weights, rng=random):
+        self.rng = rng
+        n = len(weights)
+        total = sum(weights)
+        scaled = [weight * n / total for weight in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        
+        # Pair each under-full slot with an over-full one that tops it up
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+    
+    def sample(self):
+        """Draw an index with probability proportional to its weight"""
+        i = self.rng.randrange(len(self.prob))
+        return i if self.rng.random() < self.prob[i] else self.alias[i]
+
 class ConsensusSimulator:
     """Main simulator for different consensus mechanisms"""
     
     def __init__(self):
+        self.rng = random.Random()  # Simulator's own generator for setup and round draws
         self.setup_validators()
         self.simulation_round = 0
     
@@ -91,43 +145,58 @@ class ConsensusSimulator:
         
         # Setup PoW Miners
         self.pow_miners = [
-            PoWMiner("MegaMiner Corp", "POW001", random.randint(50, 200)),
-            PoWMiner("CryptoPool Ltd", "POW002", random.randint(50, 200)),
-            PoWMiner("HashForce Inc", "POW003", random.randint(50, 200)),
-            PoWMiner("DigitalMining Co", "POW004", random.randint(50, 200))
+            PoWMiner("MegaMiner Corp", "POW001", self.rng.randint(50, 200)),
+            PoWMiner("CryptoPool Ltd", "POW002", self.rng.randint(50, 200)),
+            PoWMiner("HashForce Inc", "POW003", self.rng.randint(50, 200)),
+            PoWMiner("DigitalMining Co", "POW004", self.rng.randint(50, 200))
         ]
         
         # Setup PoS Stakers
         self.pos_stakers = [
-            PoSStaker("Alice", "POS001", random.randint(10000, 50000)),
-            PoSStaker("Bob", "POS002", random.randint(10000, 50000)),
-            PoSStaker("Charlie", "POS003", random.randint(10000, 50000)),
-            PoSStaker("Diana", "POS004", random.randint(10000, 50000))
+            PoSStaker("Alice", "POS001", self.rng.randint(10000, 50000)),
+            PoSStaker("Bob", "POS002", self.rng.randint(10000, 50000)),
+            PoSStaker("Charlie", "POS003", self.rng.randint(10000, 50000)),
+            PoSStaker("Diana", "POS004", self.rng.randint(10000, 50000))
         ]
         
         # Setup DPoS Delegates
         self.dpos_delegates = [
-            DPoSDelegate("TechNode", "DPOS001", random.randint(70, 95)),
-            DPoSDelegate("CommunityPool", "DPOS002", random.randint(70, 95)),
-            DPoSDelegate("SecureValidator", "DPOS003", random.randint(70, 95)),
-            DPoSDelegate("PublicService", "DPOS004", random.randint(70, 95))
+            DPoSDelegate("TechNode", "DPOS001", self.rng.randint(70, 95)),
+            DPoSDelegate("CommunityPool", "DPOS002", self.rng.randint(70, 95)),
+            DPoSDelegate("SecureValidator", "DPOS003", self.rng.randint(70, 95)),
+            DPoSDelegate("PublicService", "DPOS004", self.rng.randint(70, 95))
         ]
         
         # Setup Voters for DPoS
         self.voters = [
-            Voter("TokenHolder1", random.randint(1000, 10000)),
-            Voter("TokenHolder2", random.randint(1000, 10000)),
-            Voter("TokenHolder3", random.randint(1000, 10000)),
-            Voter("TokenHolder4", random.randint(1000, 10000)),
-            Voter("TokenHolder5", random.randint(1000, 10000)),
-            Voter("Whale", random.randint(50000, 100000))  # Large holder
+            Voter("TokenHolder1", self.rng.randint(1000, 10000)),
+            Voter("TokenHolder2", self.rng.randint(1000, 10000)),
+            Voter("TokenHolder3", self.rng.randint(1000, 10000)),
+            Voter("TokenHolder4", self.rng.randint(1000, 10000)),
+            Voter("TokenHolder5", self.rng.randint(1000, 10000)),
+            Voter("Whale", self.rng.randint(50000, 100000))  # Large holder
         ]
         
+        # Precompute PoS selection table (rebuilt when stakes change)
+        self.build_pos_sampler()
+        
         # Simulate voting for DPoS
         self.simulate_dpos_voting()
         
         print("✅ Setup complete!\n")
     
+    def build_pos_sampler(self):
+        """Build the stake-weighted alias table used to pick PoS validators"""
+        stake_weights = [staker.calculate_stake_weight() for staker in self.pos_stakers]
+        self.pos_sampler = AliasSampler(stake_weights, self.rng)
+        self._pos_sampler_version = PoSStaker.stake_version
+    
+    def get_pos_sampler(self):
+        """Return the PoS alias table, rebuilding it if any stake changed since it was built"""
+        if self._pos_sampler_version != PoSStaker.stake_version:
+            self.build_pos_sampler()
+        return self.pos_sampler
+    
     def simulate_dpos_voting(self):
         """Simulate voting process for DPoS"""
         print("🗳️  SIMULATING DPoS VOTING PROCESS")
@@ -135,7 +204,7 @@ class ConsensusSimulator:
         
         for voter in self.voters:
             # Vote for random delegate (could be based on reputation or other factors)
-            chosen_delegate = random.choice(self.dpos_delegates)
+            chosen_delegate = self.rng.choice(self.dpos_delegates)
             voter.vote_for_delegate(chosen_delegate)
             print(f"{voter.name} votes for {chosen_delegate.name} with {voter.token_balance:,} tokens")
         
@@ -173,7 +242,7 @@ class ConsensusSimulator:
         mining_attempts = {}
         for miner in self.pow_miners:
             # Higher hash power = more attempts = better chance
-            attempts = miner.hash_power * random.randint(1, 10)
+            attempts = miner.hash_power * self.rng.randint(1, 10)
             mining_attempts[miner] = attempts
             print(f"{miner.name}: {attempts:,} hash attempts")
         
@@ -198,6 +267,8 @@ class ConsensusSimulator:
         print("Selection: Weighted random selection by stake amount")
         print("-" * 50)
         
+        pos_sampler = self.get_pos_sampler()
+        
         # Calculate total stake
         total_stake = sum(staker.calculate_stake_weight() for staker in self.pos_stakers)
         
@@ -208,8 +279,7 @@ class ConsensusSimulator:
             print(f"{staker.name}: {stake_weight:,.0f} effective stake ({percentage:.1f}% chance)")
         
         # Weighted random selection
-        stakes = [staker.calculate_stake_weight() for staker in self.pos_stakers]
-        winner = random.choices(self.pos_stakers, weights=stakes)[0]
+        winner = self.pos_stakers[pos_sampler.sample()]
         
         print(f"\n🏆 PoS WINNER: {winner}")
         print(f"Reason: Selected via weighted randomness based on stake")
@@ -217,7 +287,7 @@ class ConsensusSimulator:
         print(f"Energy consumption: Very low (no mining required)")
         
         winner.blocks_validated += 1
-        winner.rewards_earned += random.uniform(0.1, 0.5)  # Transaction fees
+        winner.rewards_earned += self.rng.uniform(0.1, 0.5)  # Transaction fees
         
         return winner
     
@@ -243,7 +313,7 @@ class ConsensusSimulator:
         print(f"Voting transparency: All votes are public and auditable")
         
         winner.blocks_validated += 1
-        winner.rewards_earned += random.uniform(0.2, 0.8)
+        winner.rewards_earned += self.rng.uniform(0.2, 0.8)
         
         return winner
     
@@ -279,45 +349,47 @@ class ConsensusSimulator:
         print(f"\n🔄 RUNNING {rounds} CONSENSUS ROUNDS")
         print("=" * 60)
         
-        pow_winners = {}
-        pos_winners = {}
-        dpos_winners = {}
+        # Draw every round's winners in one batch per mechanism, then report them
+        # PoW (simplified): attempts = hash power * random effort, highest wins
+        randint = self.rng.randint
+        pow_round_winners = [max(self.pow_miners, key=lambda m: m.hash_power * randint(1, 10)).name
+                             for _ in range(rounds)]
+        
+        # PoS
+        sample = self.get_pos_sampler().sample
+        pos_round_winners = [self.pos_stakers[sample()].name for _ in range(rounds)]
         
-        for round_num in range(1, rounds + 1):
+        # DPoS (same winner each time unless votes change)
+        dpos_winner = max(self.dpos_delegates, key=lambda d: d.votes_received).name
+        dpos_round_winners = [dpos_winner] * rounds
+        
+        for round_num, (pow_winner, pos_winner, dpos_winner) in enumerate(
+                zip(pow_round_winners, pos_round_winners, dpos_round_winners), start=1):
             print(f"\n--- ROUND {round_num} ---")
-            
-            # PoW (simplified display)
-            pow_attempts = {miner.name: miner.hash_power * random.randint(1, 10) 
-                           for miner in self.pow_miners}
-            pow_winner = max(pow_attempts.keys(), key=lambda m: pow_attempts[m])
-            pow_winners[pow_winner] = pow_winners.get(pow_winner, 0) + 1
             print(f"PoW: {pow_winner}")
-            
-            # PoS
-            stakes = [staker.calculate_stake_weight() for staker in self.pos_stakers]
-            pos_winner = random.choices(self.pos_stakers, weights=stakes)[0].name
-            pos_winners[pos_winner] = pos_winners.get(pos_winner, 0) + 1
             print(f"PoS: {pos_winner}")
-            
-            # DPoS (same winner each time unless votes change)
-            dpos_winner = max(self.dpos_delegates, key=lambda d: d.votes_received).name
-            dpos_winners[dpos_winner] = dpos_winners.get(dpos_winner, 0) + 1
             print(f"DPoS: {dpos_winner}")
         
+        # Tally each mechanism's winners in one pass
+        pow_winners = Counter(pow_round_winners)
+        pos_winners = Counter(pos_round_winners)
+        dpos_winners = Counter(dpos_round_winners)
+        
+        def format_tally(winners):
+            return "\n".join(f"  {winner}: {count}/{rounds} blocks ({count/rounds*100:.1f}%)"
+                             for winner, count in winners.items())
+        
         # Show statistics
         print(f"\n📊 {rounds}-ROUND STATISTICS")
         print("=" * 40)
         print("PoW Winners:")
-        for winner, count in pow_winners.items():
-            print(f"  {winner}: {count}/{rounds} blocks ({count/rounds*100:.1f}%)")
+        print(format_tally(pow_winners))
         
         print("\nPoS Winners:")
-        for winner, count in pos_winners.items():
-            print(f"  {winner}: {count}/{rounds} blocks ({count/rounds*100:.1f}%)")
+        print(format_tally(pos_winners))
         
         print("\nDPoS Winners:")
-        for winner, count in dpos_winners.items():
-            print(f"  {winner}: {count}/{rounds} blocks ({count/rounds*100:.1f}%)")
+        print(format_tally(dpos_winners))
 
 def interactive_consensus():
     """Interactive consensus mechanism explorer"""
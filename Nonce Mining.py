@@ -1,33 +1,165 @@
 import hashlib
 import time
-from datetime import datetime
-import threading
+import multiprocessing
+import os
+import queue
 import sys
+from itertools import count
+from collections import deque
+from functools import lru_cache
+
+MINING_BATCH_SIZE = 10000  # Nonces tried between progress checkpoints
+PROGRESS_LOG_SIZE = 8  # Most recent checkpoints kept for the mining summary
+PARALLEL_MIN_DIFFICULTY = 5  # Below this, starting worker processes costs more than the search
+
+@lru_cache(maxsize=None)
+def _difficulty_target(difficulty):
+    """Return the 32-byte big-endian target that valid digests must sort below"""
+    # `difficulty` leading hex zeros means the hash, read as a 256-bit number, is
+    # below 2**(256 - 4*difficulty). Comparing equal-length big-endian bytes is the
+    # same numeric comparison, without an int.from_bytes conversion per attempt.
+    return (1 << (256 - 4 * difficulty)).to_bytes(32, "big")
+
+def _mine_range(prefix, target, start_nonce, end_nonce):
+    """Return (nonce, digest) for the first nonce in [start_nonce, end_nonce) whose digest is below target, or None"""
+    # Absorb the encoded block prefix once; each attempt only hashes the nonce on top of it
+    midstate = hashlib.sha256(prefix)
+    
+    for nonce in range(start_nonce, end_nonce):
+        sha = midstate.copy()
+        sha.update(b"%d" % nonce)  # ASCII nonce straight to bytes, no str + encode
+        digest = sha.digest()
+        
+        # Check if hash meets difficulty requirement
+        if digest < target:
+            return nonce, digest
+    
+    return None
+
+def _mine(prefix, difficulty, start_nonce, progress):
+    """Search nonces upward from start_nonce; returns (nonce, digest, attempts)"""
+    target = _difficulty_target(difficulty)
+    
+    # Hash nonces in fixed-size batches so the inner loop is only hash + compare
+    for batch_start in count(start_nonce, MINING_BATCH_SIZE):
+        result = _mine_range(prefix, target, batch_start, batch_start + MINING_BATCH_SIZE)
+        if result is not None:
+            nonce, digest = result
+            return nonce, digest, nonce - start_nonce + 1
+        
+        # Record (attempts, nonce) after every batch; printing here would stall mining on stdout
+        last_nonce = batch_start + MINING_BATCH_SIZE - 1
+        progress.append((last_nonce - start_nonce + 1, last_nonce))
+
+def _mine_parallel(prefix, difficulty, start_nonce, workers, progress):
+    """Search nonces across worker processes; returns (nonce, digest, attempts) from the first hit to arrive"""
+    # hashlib holds the GIL for inputs this small, so threads would not hash in
+    # parallel. Worker processes each take one batch of nonces at a time.
+    target = _difficulty_target(difficulty)
+    results = queue.SimpleQueue()
+    next_start = start_nonce
+    searched = 0
+    
+    with multiprocessing.Pool(workers) as pool:
+        def submit_batch():
+            nonlocal next_start
+            batch_start = next_start
+            pool.apply_async(_mine_range, (prefix, target, batch_start, batch_start + MINING_BATCH_SIZE),
+                             callback=lambda result: results.put((batch_start, result)),
+                             error_callback=lambda error: results.put((batch_start, error)))
+            next_start += MINING_BATCH_SIZE
+        
+        # Keep two batches queued per worker so no process idles between batches
+        for _ in range(2 * workers):
+            submit_batch()
+        
+        # Take batches in completion order: a hit is returned as soon as it arrives instead
+        # of waiting for lower, still-running batches. Leaving the pool stops the rest.
+        while True:
+            batch_start, result = results.get()
+            if isinstance(result, BaseException):
+                raise result
+            if result is not None:
+                # Count the batches that finished plus the winner's share of its own batch
+                nonce, digest = result
+                return nonce, digest, searched + nonce - batch_start + 1
+            
+            # Record (attempts, nonce) after every finished batch
+            searched += MINING_BATCH_SIZE
+            progress.append((searched, batch_start + MINING_BATCH_SIZE - 1))
+            submit_batch()
+
+def _hash_rate(attempts, seconds):
+    """Hashes per second (0 if the run took no measurable time)"""
+    return attempts / seconds if seconds > 0 else 0
 
 class Block:
-    def __init__(self, index, data, previous_hash, difficulty=0):
+    def __init__(self, index, data, previous_hash, difficulty=0, workers=1):
         self.index = index
         self.timestamp = time.time()
+        self._timestamp_str = None
         self.data = data
         self.previous_hash = previous_hash
         self.nonce = 0
         self.difficulty = difficulty
-        self.hash = ""
+        self.digest = b""  # Raw SHA-256 digest; `hash` gives its hex form
         self.mining_time = 0
         self.attempts = 0
         
         # If difficulty is set, mine the block
         if difficulty > 0:
-            self.mine_block(difficulty)
+            self.mine_block(difficulty, workers)
         else:
-            self.hash = self.calculate_hash()
+            self.digest = self.calculate_digest()
+    
+    @property
+    def hash(self):
+        """Hex form of the block digest, for display and for linking the next block"""
+        return self.digest.hex()
+    
+    @property
+    def hash_rate(self):
+        """Hashes per second achieved while mining (0 if mining took no measurable time)"""
+        return _hash_rate(self.attempts, self.mining_time)
+    
+    @property
+    def timestamp_str(self):
+        """Timestamp formatted for display (computed once)"""
+        if self._timestamp_str is None:
+            self._timestamp_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.timestamp))
+        return self._timestamp_str
+    
+    @staticmethod
+    def build_prefix(index, timestamp, data, previous_hash):
+        """Encode the hashed block fields that stay fixed while mining (all but the nonce)"""
+        return f"{index}{timestamp}{data}{previous_hash}".encode()
+    
+    @staticmethod
+    def mine_header(prefix, difficulty, start_nonce=1, workers=1, progress=None):
+        """Mine an encoded block prefix; returns (nonce, digest, attempts, mining_time)"""
+        if progress is None:
+            progress = deque(maxlen=PROGRESS_LOG_SIZE)
+        
+        # Time the whole search with two monotonic clock reads; nothing is timed per attempt
+        start_time = time.perf_counter()
+        if workers > 1 and difficulty >= PARALLEL_MIN_DIFFICULTY:
+            nonce, digest, attempts = _mine_parallel(prefix, difficulty, start_nonce, workers, progress)
+        else:
+            nonce, digest, attempts = _mine(prefix, difficulty, start_nonce, progress)
+        mining_time = time.perf_counter() - start_time
+        
+        return nonce, digest, attempts, mining_time
+    
+    def calculate_digest(self):
+        """Calculate the raw SHA-256 digest of the block from its current fields"""
+        prefix = self.build_prefix(self.index, self.timestamp, self.data, self.previous_hash)
+        return hashlib.sha256(prefix + b"%d" % self.nonce).digest()
     
     def calculate_hash(self):
         """Calculate SHA-256 hash of the block"""
-        block_string = f"{self.index}{self.timestamp}{self.data}{self.previous_hash}{self.nonce}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        return self.calculate_digest().hex()
     
-    def mine_block(self, difficulty):
+    def mine_block(self, difficulty, workers=1):
         """Mine the block using Proof-of-Work"""
         target = "0" * difficulty  # Target pattern (e.g., "0000")
         
@@ -36,29 +168,20 @@ class Block:
         print(f"Difficulty: {difficulty} leading zeros")
         print("-" * 50)
         
-        start_time = time.time()
-        self.attempts = 0
+        progress = deque(maxlen=PROGRESS_LOG_SIZE)
+        self.nonce, self.digest, self.attempts, self.mining_time = self.mine_header(
+            self.build_prefix(self.index, self.timestamp, self.data, self.previous_hash),
+            difficulty, self.nonce + 1, workers, progress)
         
-        # Keep incrementing nonce until hash meets difficulty requirement
-        while True:
-            self.nonce += 1
-            self.attempts += 1
-            self.hash = self.calculate_hash()
-            
-            # Print progress every 10000 attempts
-            if self.attempts % 10000 == 0:
-                print(f"Attempt {self.attempts:,}: nonce={self.nonce}, hash={self.hash[:20]}...")
-            
-            # Check if hash meets difficulty requirement
-            if self.hash.startswith(target):
-                self.mining_time = time.time() - start_time
-                print(f"\n✅ BLOCK MINED SUCCESSFULLY!")
-                print(f"Final hash: {self.hash}")
-                print(f"Nonce found: {self.nonce:,}")
-                print(f"Total attempts: {self.attempts:,}")
-                print(f"Mining time: {self.mining_time:.2f} seconds")
-                print(f"Hash rate: {self.attempts/self.mining_time:.0f} hashes/second")
-                break
+        for attempts, nonce in progress:
+            print(f"Attempt {attempts:,}: nonce={nonce}")
+        
+        print(f"\n✅ BLOCK MINED SUCCESSFULLY!")
+        print(f"Final hash: {self.hash}")
+        print(f"Nonce found: {self.nonce:,}")
+        print(f"Total attempts: {self.attempts:,}")
+        print(f"Mining time: {self.mining_time:.2f} seconds")
+        print(f"Hash rate: {self.hash_rate:.0f} hashes/second")
     
     def display(self):
         """Display block information"""
@@ -66,7 +189,7 @@ class Block:
         print(f"BLOCK {self.index}")
         print(f"{'='*60}")
         print(f"Index:        {self.index}")
-        print(f"Timestamp:    {datetime.fromtimestamp(self.timestamp).strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Timestamp:    {self.timestamp_str}")
         print(f"Data:         {self.data}")
         print(f"Previous Hash: {self.previous_hash}")
         print(f"Nonce:        {self.nonce:,}")
@@ -81,6 +204,7 @@ class MiningBlockchain:
     def __init__(self):
         self.chain = []
         self.difficulty = 2  # Default difficulty
+        self.workers = 1  # Processes used for high-difficulty blocks (parallel mining is opt-in)
     
     def create_genesis_block(self, difficulty=0):
         """Create the first block in the chain"""
@@ -101,7 +225,7 @@ class MiningBlockchain:
         previous_block = self.get_latest_block()
         mining_difficulty = difficulty if difficulty is not None else self.difficulty
         
-        new_block = Block(len(self.chain), data, previous_block.hash, mining_difficulty)
+        new_block = Block(len(self.chain), data, previous_block.hash, mining_difficulty, self.workers)
         self.chain.append(new_block)
         return new_block
     
@@ -126,7 +250,7 @@ class MiningBlockchain:
             print(f"{'='*60}")
             print(f"Total mining time: {total_time:.2f} seconds")
             print(f"Total attempts: {total_attempts:,}")
-            print(f"Average hash rate: {total_attempts/total_time:.0f} hashes/second")
+            print(f"Average hash rate: {_hash_rate(total_attempts, total_time):.0f} hashes/second")
             print(f"{'='*60}")
 
 def difficulty_comparison():
@@ -141,14 +265,16 @@ def difficulty_comparison():
         print(f"\n🔍 Testing Difficulty Level: {diff}")
         print(f"Target: Hash must start with {'0' * diff}")
         
-        # Create a test block
-        test_block = Block(1, f"Test block for difficulty {diff}", "0" * 64, diff)
+        # Mine a test header directly; no Block object is needed to compare difficulties
+        prefix = Block.build_prefix(1, time.time(), f"Test block for difficulty {diff}", "0" * 64)
+        nonce, digest, attempts, mining_time = Block.mine_header(prefix, diff)
+        print(f"Found nonce {nonce:,} in {mining_time:.2f} seconds: {digest.hex()}")
         
         results.append({
             'difficulty': diff,
-            'attempts': test_block.attempts,
-            'time': test_block.mining_time,
-            'hash_rate': test_block.attempts / test_block.mining_time if test_block.mining_time > 0 else 0
+            'attempts': attempts,
+            'time': mining_time,
+            'hash_rate': _hash_rate(attempts, mining_time)
         })
     
     # Display comparison
@@ -176,9 +302,10 @@ def interactive_mining():
         print("3. Display blockchain")
         print("4. Mine multiple blocks")
         print("5. Quick difficulty comparison")
-        print("6. Exit")
+        print("6. Set worker processes")
+        print("7. Exit")
         
-        choice = input(f"\nCurrent difficulty: {blockchain.difficulty} | Choose option (1-6): ").strip()
+        choice = input(f"\nCurrent difficulty: {blockchain.difficulty} | Workers: {blockchain.workers} | Choose option (1-7): ").strip()
         
         if choice == "1":
             data = input("Enter block data: ")
@@ -217,11 +344,23 @@ def interactive_mining():
             quick_comparison()
         
         elif choice == "6":
+            try:
+                max_workers = os.cpu_count() or 1
+                new_workers = int(input(f"Enter worker processes (1-{max_workers}): "))
+                if 1 <= new_workers <= max_workers:
+                    blockchain.workers = new_workers
+                    print(f"Workers set to {new_workers} (used from difficulty {PARALLEL_MIN_DIFFICULTY} up)")
+                else:
+                    print(f"Please enter a number between 1 and {max_workers}!")
+            except ValueError:
+                print("Please enter a valid number!")
+        
+        elif choice == "7":
             print("Happy mining! 🎉")
             break
         
         else:
-            print("Invalid choice! Please select 1-6.")
+            print("Invalid choice! Please select 1-7.")
 
 def quick_comparison():
     """Quick comparison of difficulties 1-3"""
@@ -230,8 +369,9 @@ def quick_comparison():
     print(f"{'-'*40}")
     
     for diff in difficulties:
-        block = Block(1, f"Test block", "0" * 64, diff)
-        print(f"{diff:<12} {block.attempts:<12,} {block.mining_time:<12.2f}")
+        prefix = Block.build_prefix(1, time.time(), "Test block", "0" * 64)
+        _, _, attempts, mining_time = Block.mine_header(prefix, diff)
+        print(f"{diff:<12} {attempts:<12,} {mining_time:<12.2f}")
 
 def demonstrate_mining():
     """Main demonstration function"""